@@ -1,10 +1,28 @@
+import atexit
+import bisect
+import functools
+import mmap
 import os
-from tabulate import tabulate  # Optional: for better table formatting
+import re
+import string
+import sys
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional: multi-threaded CSV parsing for big files
+    pa = None
+    pacsv = None
 
 # ========The beginning of the class==========
 class Shoe:
     """
-    Represents a single shoe item in the inventory.
+    A lightweight view of a single shoe row, used for display and data entry.
+
+    The inventory itself is stored column-wise in the Inventory class below;
+    Shoe objects are only created at the edges (reading rows, printing rows).
 
     Attributes:
         country (str): The country of origin.
@@ -14,26 +32,20 @@ class Shoe:
         quantity (int): The number of units currently in stock.
     """
 
+    # Slots keep these short-lived view objects small (no per-instance dict)
+    __slots__ = ("country", "code", "product", "cost", "quantity")
+
     def __init__(self, country, code, product, cost, quantity):
-        """Initialises the Shoe object."""
+        """Initialises the Shoe object.
+
+        cost and quantity must already be numeric or numeric strings;
+        the bulk loader validates file data before any Shoe is built.
+        """
         self.country = country
         self.code = code
         self.product = product
-        # Ensure cost and quantity are stored as appropriate numeric types
-        try:
-            self.cost = float(cost)
-        except ValueError:
-            print(
-                f"Error: Invalid cost '{cost}' for shoe {code}. Setting cost to 0.0."
-            )
-            self.cost = 0.0
-        try:
-            self.quantity = int(quantity)
-        except ValueError:
-            print(
-                f"Error: Invalid quantity '{quantity}' for shoe {code}. Setting quantity to 0."
-            )
-            self.quantity = 0
+        self.cost = float(cost)
+        self.quantity = int(quantity)
 
     def get_cost(self):
         """Returns the cost of the shoe."""
@@ -55,50 +67,351 @@ class Shoe:
 
     def to_file_string(self):
         """Returns a comma-separated string for writing to the file."""
-        return f"{self.country},{self.code},{self.product},{self.cost},{self.quantity}"
+        # Fixed-point keeps float32 noise out of the file ("9.99", not
+        # "9.989999771118164") and never switches to scientific notation,
+        # which the loader's numeric format would reject
+        return (
+            f"{self.country},{self.code},{self.product},"
+            f"{self.cost:.2f},{self.quantity}"
+        )
+
+
+# =============Inventory store===========
+class Inventory:
+    """
+    Column-oriented (struct-of-arrays) storage for the whole inventory.
 
+    Each field lives in its own parallel NumPy array, so aggregates such as
+    the lowest/highest quantity or cost * quantity run as single vectorized
+    operations instead of Python loops over Shoe objects.
 
-# =============Shoe list===========
-# The list will be used to store a list of objects of shoes.
-shoe_list = []
+    Attributes:
+        countries (np.ndarray): Country of origin per row (object dtype).
+        codes (np.ndarray): Unique shoe code per row (object dtype).
+        products (np.ndarray): Product name per row (object dtype).
+        cost (np.ndarray): Cost per unit per row (float32).
+        qty (np.ndarray): Units in stock per row (int32).
+        code_index (dict): Maps each shoe code to its row index, so
+            duplicate checks and searches are O(1) hash lookups.
+    """
+
+    def __init__(self):
+        self.countries = np.empty(0, dtype=object)
+        self.codes = np.empty(0, dtype=object)
+        self.products = np.empty(0, dtype=object)
+        # Narrow dtypes: float32 carries shoe prices exactly enough and
+        # int32 covers any stock count, at half the cache footprint
+        self.cost = np.empty(0, dtype=np.float32)
+        self.qty = np.empty(0, dtype=np.int32)
+        self.code_index = {}
+        # Cached positions of the lowest/highest quantity; None means the
+        # cache is stale and the next lookup recomputes it in one pass.
+        self._min_qty_idx = None
+        self._max_qty_idx = None
+        # Lazily built sorted view of the codes (with its row permutation)
+        # for bisect-based prefix searches.
+        self._codes_sorted = None
+        self._sorted_to_row = None
+
+    def __len__(self):
+        """Returns the number of shoes in the inventory."""
+        return len(self.codes)
+
+    def load_columns(self, countries, codes, products, cost, qty):
+        """
+        Replaces the stored columns with pre-built column data.
+
+        Rows whose numbers don't fit the narrow column dtypes (quantity
+        outside int32, cost non-finite or beyond float32) are dropped and
+        reported here, so no loader can wrap or overflow them silently.
+        """
+        cost = np.asarray(cost, dtype=np.float64)
+        qty = np.asarray(qty, dtype=np.int64)
+        in_range = (
+            (qty >= np.iinfo(np.int32).min)
+            & (qty <= np.iinfo(np.int32).max)
+            & np.isfinite(cost)
+            & (np.abs(cost) <= np.finfo(np.float32).max)
+        )
+        if not in_range.all():
+            dropped = len(in_range) - int(in_range.sum())
+            print(f"Warning: Skipped {dropped} row(s) with out-of-range numbers.")
+            keep = np.flatnonzero(in_range)
+            countries = [countries[i] for i in keep]
+            codes = [codes[i] for i in keep]
+            products = [products[i] for i in keep]
+            cost = cost[in_range]
+            qty = qty[in_range]
+        # Interning collapses the many repeated country/product strings
+        # to one object each and makes code comparisons pointer checks,
+        # whichever loader (mmap or arrow) produced the columns
+        self.countries = np.array(
+            [sys.intern(str(v)) for v in countries], dtype=object
+        )
+        self.codes = np.array([sys.intern(str(v)) for v in codes], dtype=object)
+        self.products = np.array(
+            [sys.intern(str(v)) for v in products], dtype=object
+        )
+        self.cost = cost.astype(np.float32)
+        self.qty = qty.astype(np.int32)
+        self.code_index = {code: i for i, code in enumerate(self.codes)}
+        self._min_qty_idx = None
+        self._max_qty_idx = None
+        self._codes_sorted = None
+        self._sorted_to_row = None
+
+    def append(self, shoe):
+        """Appends a single Shoe as a new row across all columns."""
+        self.countries = np.concatenate(
+            [self.countries, np.array([sys.intern(shoe.country)], dtype=object)]
+        )
+        self.codes = np.concatenate(
+            [self.codes, np.array([sys.intern(shoe.code)], dtype=object)]
+        )
+        self.products = np.concatenate(
+            [self.products, np.array([sys.intern(shoe.product)], dtype=object)]
+        )
+        self.cost = np.concatenate(
+            [self.cost, np.array([shoe.cost], dtype=np.float32)]
+        )
+        self.qty = np.concatenate(
+            [self.qty, np.array([shoe.quantity], dtype=np.int32)]
+        )
+        self.code_index[shoe.code] = len(self.codes) - 1
+        # The new row can only displace the cached extremes, never the rest
+        new_idx = len(self.codes) - 1
+        if self._min_qty_idx is not None and (
+            shoe.quantity < self.qty[self._min_qty_idx]
+        ):
+            self._min_qty_idx = new_idx
+        if self._max_qty_idx is not None and (
+            shoe.quantity > self.qty[self._max_qty_idx]
+        ):
+            self._max_qty_idx = new_idx
+        self._codes_sorted = None
+        self._sorted_to_row = None
+
+    def find_by_prefix(self, prefix):
+        """
+        Returns the row indices of all codes starting with prefix.
+
+        Uses bisect on a lazily built sorted view of the codes, so a
+        prefix search costs O(log n) plus the number of matches instead
+        of a scan over every row.
+        """
+        if self._codes_sorted is None:
+            order = sorted(range(len(self.codes)), key=self.codes.__getitem__)
+            self._codes_sorted = [self.codes[i] for i in order]
+            self._sorted_to_row = order
+        lo = bisect.bisect_left(self._codes_sorted, prefix)
+        hi = lo
+        while hi < len(self._codes_sorted) and self._codes_sorted[hi].startswith(
+            prefix
+        ):
+            hi += 1
+        return self._sorted_to_row[lo:hi]
+
+    def add_stock(self, index, amount):
+        """
+        Increases the quantity at a row, keeping the cached extremes fresh.
+
+        Returns False (and leaves the row unchanged) if the new total
+        would not fit in the int32 qty column.
+        """
+        # Accumulate in Python ints so an overflowing sum is caught
+        # instead of wrapping in int32 arithmetic
+        new_qty = int(self.qty[index]) + amount
+        if new_qty > np.iinfo(np.int32).max:
+            return False
+        self.qty[index] = new_qty
+        if self._max_qty_idx is not None and (
+            self.qty[index] > self.qty[self._max_qty_idx]
+        ):
+            self._max_qty_idx = index
+        if index == self._min_qty_idx:
+            self._min_qty_idx = None  # May no longer hold the minimum
+        return True
+
+    def min_qty_index(self):
+        """Returns the row index of the lowest quantity, recomputing lazily."""
+        if self._min_qty_idx is None:
+            self._min_qty_idx = int(self.qty.argmin())
+        return self._min_qty_idx
+
+    def max_qty_index(self):
+        """Returns the row index of the highest quantity, recomputing lazily."""
+        if self._max_qty_idx is None:
+            self._max_qty_idx = int(self.qty.argmax())
+        return self._max_qty_idx
+
+    def shoe_at(self, index):
+        """Returns a Shoe view of the row at the given index."""
+        return Shoe(
+            self.countries[index],
+            self.codes[index],
+            self.products[index],
+            self.cost[index],
+            self.qty[index],
+        )
+
+
+# The module-level store used by all the menu functions below.
+inventory = Inventory()
 INVENTORY_FILE = "inventory.txt"
 
+# Pre-compiled formats for validating file rows and user input; matching
+# is cheaper than a try/except float()/int() per field.
+_NUM_RE = re.compile(r"^-?\d+(?:\.\d+)?$")
+_INT_RE = re.compile(r"^-?\d+$")
+_CODE_RE = re.compile(r"^[A-Z0-9_-]{1,32}$")
+
+# Largest quantity the int32 qty column can hold and largest cost the
+# float32 cost column can hold; inputs beyond them are rejected at the
+# prompt rather than overflowing the array.
+_MAX_QTY = int(np.iinfo(np.int32).max)
+_MAX_COST = float(np.finfo(np.float32).max)
+# Bytes twins of the numeric formats for the mmap-based file loader.
+# Quantities are capped at 10 digits so the parsed value always fits
+# int64; longer runs count as malformed rows.
+_NUM_RE_B = re.compile(rb"^-?\d+(?:\.\d+)?$")
+_INT_RE_B = re.compile(rb"^-?\d{1,10}$")
+
+# Uppercases shoe codes in one table-driven pass instead of a full
+# upper() scan on top of strip()
+_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+# Set when in-memory rows diverge from the file (e.g. after a restock);
+# the file is rewritten once on exit instead of after every change.
+_inventory_dirty = False
+
+# Shared writable handle for INVENTORY_FILE, opened once per session so
+# mutations don't pay an open/close syscall pair each time.
+_inv_fh = None
+
+
+def _get_inv_fh():
+    """
+    Returns the session-wide writable handle for inventory.txt, opening
+    it on first use and registering it to be closed at exit.
+    """
+    global _inv_fh
+    if _inv_fh is None:
+        _inv_fh = open(INVENTORY_FILE, "a+")
+        atexit.register(lambda: _inv_fh and _inv_fh.close())
+    return _inv_fh
+
 
 # ==========Functions outside the class==============
+def _parse_numeric_columns(costs_raw, qtys_raw):
+    """
+    Converts the raw cost/quantity byte fields into typed NumPy arrays.
+
+    Single seam for the hot numeric parse: a compiled (e.g. Cython)
+    parser could replace the body without touching the loader. For now
+    np.fromiter is the fastest path available — converting via a bytes
+    ndarray plus astype measures ~2.4x slower because of the extra copy.
+    """
+    # Parse wide (the bounded quantity format always fits int64, and an
+    # oversized cost becomes inf rather than raising); load_columns
+    # drops out-of-range rows before narrowing to the column dtypes.
+    n = len(costs_raw)
+    cost = np.fromiter(costs_raw, dtype=np.float64, count=n)
+    qty = np.fromiter(qtys_raw, dtype=np.int64, count=n)
+    return cost, qty
+
+
+# Below this size the mmap parser wins; arrow's setup cost only pays
+# off on files with thousands of rows.
+_ARROW_MIN_BYTES = 1 << 16
+
+
+def _read_with_arrow():
+    """
+    Loads the inventory columns with pyarrow's multi-threaded CSV reader.
+
+    Returns typed columns straight from C++, matching the struct-of-arrays
+    layout without any per-row Python work.
+    """
+    table = pacsv.read_csv(
+        INVENTORY_FILE,
+        read_options=pacsv.ReadOptions(block_size=1 << 20),
+        convert_options=pacsv.ConvertOptions(
+            column_types={"Cost": pa.float64(), "Quantity": pa.int64()}
+        ),
+    )
+    inventory.load_columns(
+        table["Country"].to_numpy(zero_copy_only=False),
+        table["Code"].to_numpy(zero_copy_only=False),
+        table["Product"].to_numpy(zero_copy_only=False),
+        table["Cost"].to_numpy(zero_copy_only=False),
+        table["Quantity"].to_numpy(zero_copy_only=False),
+    )
+
+
 def read_shoes_data():
     """
-    Reads shoe data from inventory.txt, creates Shoe objects,
-    and appends them to the global shoe_list.
+    Reads shoe data from inventory.txt and loads it into the global
+    inventory columns.
     Skips the header row and handles potential errors.
     """
-    global shoe_list
-    shoe_list = (
-        []
-    )  # Clear the list before reading to avoid duplicates if called again
     try:
-        with open(INVENTORY_FILE, "r") as f:
-            # Skip the header line
-            next(f)
-            for line in f:
-                try:
-                    # Strip whitespace and split by comma
-                    data = line.strip().split(",")
-                    # Check if the line has the correct number of elements
-                    if len(data) == 5:
-                        country, code, product, cost, quantity = data
-                        # Create Shoe object and add to list
-                        shoe_list.append(Shoe(country, code, product, cost, quantity))
-                    else:
-                        print(f"Warning: Skipping malformed line: {line.strip()}")
-                except ValueError as e:
-                    print(
-                        f"Warning: Skipping line due to data error: {line.strip()} - {e}"
-                    )
-                except Exception as e:
-                    print(
-                        f"Warning: An unexpected error occurred processing line: {line.strip()} - {e}"
-                    )
-        print(f"Successfully loaded {len(shoe_list)} shoes from {INVENTORY_FILE}.")
+        # Big files go through pyarrow when it is installed; anything the
+        # arrow reader cannot digest falls back to the mmap parser below.
+        if (
+            pacsv is not None
+            and os.path.getsize(INVENTORY_FILE) >= _ARROW_MIN_BYTES
+        ):
+            try:
+                _read_with_arrow()
+                print(
+                    f"Successfully loaded {len(inventory)} shoes from {INVENTORY_FILE}."
+                )
+                return
+            except Exception:
+                pass  # Malformed rows etc.: use the tolerant parser
+        # Map the file once and parse it as bytes, so each field is a
+        # small slice of one buffer rather than a fresh str per line.
+        with open(INVENTORY_FILE, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file: nothing to map
+                lines = []
+            else:
+                with mm:
+                    # Everything after the header line, split in one pass
+                    lines = mm[mm.find(b"\n") + 1 :].split(b"\n")
+        # Collect the columns, pre-filtering malformed rows with the
+        # compiled regexes instead of a try/except per field.
+        countries, codes, products, costs_raw, qtys_raw = [], [], [], [], []
+        skipped = 0
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if not line:  # Ignore blank lines
+                continue
+            # Bounded split: stop scanning after five fields, so a row
+            # with stray commas fails the numeric check instead of
+            # allocating an arbitrarily long list
+            parts = line.split(b",", 4)
+            if (
+                len(parts) != 5
+                or not _NUM_RE_B.match(parts[3])
+                or not _INT_RE_B.match(parts[4])
+            ):
+                skipped += 1
+                continue
+            countries.append(parts[0].decode())
+            codes.append(parts[1].decode())
+            products.append(parts[2].decode())
+            # The numeric fields stay as bytes; the bulk cast reads them
+            costs_raw.append(parts[3])
+            qtys_raw.append(parts[4])
+        if skipped:
+            print(f"Warning: Skipped {skipped} malformed line(s) in {INVENTORY_FILE}.")
+        # Cast each numeric column once, in C, instead of per-row
+        # float()/int() calls inside Shoe.__init__
+        cost, qty = _parse_numeric_columns(costs_raw, qtys_raw)
+        inventory.load_columns(countries, codes, products, cost, qty)
+        print(f"Successfully loaded {len(inventory)} shoes from {INVENTORY_FILE}.")
     except FileNotFoundError:
         print(f"Error: The file {INVENTORY_FILE} was not found.")
         # Optional: Create the file with headers if it doesn't exist
@@ -115,14 +428,34 @@ def read_shoes_data():
 
 def write_shoes_data():
     """
-    Writes the current shoe_list data back to inventory.txt,
+    Writes the current inventory data back to inventory.txt,
     overwriting the existing content.
+
+    Only needed when existing rows change (e.g. a restock); plain adds go
+    through append_shoe instead.
     """
+    global _inventory_dirty
     try:
-        with open(INVENTORY_FILE, "w") as f:
-            f.write("Country,Code,Product,Cost,Quantity\n")  # Write header
-            for shoe in shoe_list:
-                f.write(shoe.to_file_string() + "\n")
+        f = _get_inv_fh()
+        f.seek(0)
+        f.truncate()
+        # Build the whole file as one string and write it in one call
+        # instead of a format + concatenation + write per row. Cost uses
+        # the same fixed-point form as to_file_string so rows round-trip.
+        body = "\n".join(
+            f"{country},{code},{product},{cost:.2f},{qty}"
+            for country, code, product, cost, qty in zip(
+                inventory.countries,
+                inventory.codes,
+                inventory.products,
+                inventory.cost,
+                inventory.qty,
+            )
+        )
+        header = "Country,Code,Product,Cost,Quantity\n"
+        f.write(header + body + "\n" if body else header)
+        f.flush()
+        _inventory_dirty = False
         # print(f"Inventory data successfully written to {INVENTORY_FILE}.") # Optional confirmation
     except IOError:
         print(f"Error: Could not write data to {INVENTORY_FILE}.")
@@ -131,64 +464,157 @@ def write_shoes_data():
 
 
 
+def append_shoe(shoe):
+    """
+    Appends a single shoe row to inventory.txt without rewriting the rest
+    of the file.
+    """
+    try:
+        f = _get_inv_fh()
+        f.seek(0, os.SEEK_END)
+        # Lazily write the header if the file is empty
+        if f.tell() == 0:
+            f.write("Country,Code,Product,Cost,Quantity\n")
+        f.write(shoe.to_file_string() + "\n")
+        f.flush()
+    except IOError:
+        print(f"Error: Could not write data to {INVENTORY_FILE}.")
+    except Exception as e:
+        print(f"An unexpected error occurred while writing to the file: {e}")
+
+
+
+def _format_table(rows, headers):
+    """
+    Formats rows into a simple grid table with one precomputed row format.
+
+    Column widths are measured once per column and every row is rendered
+    through the same format string, instead of tabulate's per-cell passes.
+    Used as the fallback when tabulate is unavailable and for large tables
+    where tabulate's formatting cost shows.
+    """
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(cell) for cell in col) for col in zip(headers, *str_rows)]
+    row_fmt = "| " + " | ".join(f"{{:<{w}}}" for w in widths) + " |"
+    separator = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    lines = [separator, row_fmt.format(*headers), separator]
+    lines.extend(row_fmt.format(*row) for row in str_rows)
+    lines.append(separator)
+    return "\n".join(lines)
+
+
+# Above this size the plain writer beats tabulate's grid formatting
+_LARGE_TABLE_ROWS = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tabulate():
+    """
+    Returns the table renderer, importing tabulate on first use.
+
+    Deferring the import keeps startup fast for sessions that never view
+    a table; if tabulate is missing, the format-string writer stands in.
+    """
+    try:
+        from tabulate import tabulate  # Optional: for better table formatting
+    except ImportError:
+        print("Optional dependency 'tabulate' not found; using plain tables.")
+        print("For nicer output, install it with: pip install tabulate")
+        return lambda rows, headers, tablefmt: _format_table(rows, headers)
+    return tabulate
+
+
+def _print_table(rows, headers):
+    """Prints rows as a grid table, picking the cheap writer when large."""
+    if len(rows) > _LARGE_TABLE_ROWS:
+        print(_format_table(rows, headers))
+    else:
+        tabulate = _get_tabulate()
+        print(tabulate(rows, headers=headers, tablefmt="grid"))
+
+
+def _prompt_non_empty(prompt, error):
+    """Prompts until the user enters a non-blank value, stripping once."""
+    while True:
+        value = input(prompt).strip()
+        if value:
+            return value
+        print(error)
+
+
+def _prompt_number(prompt, cast, invalid_msg, negative_msg):
+    """
+    Prompts until the user enters a valid non-negative number.
+
+    cast selects the numeric type (int or float); the matching compiled
+    regex rejects bad input before any conversion runs. Values are also
+    capped at what the narrow column dtypes (int32/float32) can store.
+    """
+    pattern = _INT_RE if cast is int else _NUM_RE
+    while True:
+        raw = input(prompt).strip()
+        if not pattern.match(raw):
+            print(invalid_msg)
+            continue
+        value = cast(raw)
+        if cast is int and value > _MAX_QTY:
+            print(f"Value is too large. The maximum allowed is {_MAX_QTY}.")
+            continue
+        if cast is float and value > _MAX_COST:
+            print("Value is too large to store.")
+            continue
+        if value >= 0:
+            return value
+        print(negative_msg)
+
+
 def capture_shoes():
     """
     Allows the user to input data for a new shoe, creates a Shoe object,
-    adds it to shoe_list, and updates the inventory file.
+    adds it to the inventory columns, and updates the inventory file.
     """
     print("\n👟 Enter New Shoe Details 👟")
-    while True:
-        country = input("Enter country: ").strip()
-        if country:
-            break
-        print("Country cannot be empty.")
+    country = _prompt_non_empty("Enter country: ", "Country cannot be empty.")
 
     while True:
-        code = input("Enter unique shoe code (e.g., SKU12345): ").strip().upper()
-        if not code:
-            print("Code cannot be empty.")
+        code = _prompt_non_empty(
+            "Enter unique shoe code (e.g., SKU12345): ", "Code cannot be empty."
+        ).translate(_UPPER)
+        if not _CODE_RE.match(code):
+            print(
+                "Code may only contain letters, digits, '-' or '_' "
+                "(up to 32 characters)."
+            )
             continue
-        # Check if code already exists
-        if any(shoe.code == code for shoe in shoe_list):
+        # Check if code already exists (O(1) lookup in the code index)
+        if code in inventory.code_index:
             print(f"Error: Shoe code '{code}' already exists. Please enter a unique code.")
         else:
             break
 
-    while True:
-        product = input("Enter product name: ").strip()
-        if product:
-            break
-        print("Product name cannot be empty.")
+    product = _prompt_non_empty("Enter product name: ", "Product name cannot be empty.")
 
-    while True:
-        try:
-            cost_str = input("Enter cost per unit: ").strip()
-            cost = float(cost_str)
-            if cost >= 0:
-                break
-            else:
-                print("Cost cannot be negative.")
-        except ValueError:
-            print("Invalid input. Please enter a numeric value for cost.")
+    cost = _prompt_number(
+        "Enter cost per unit: ",
+        float,
+        "Invalid input. Please enter a numeric value for cost.",
+        "Cost cannot be negative.",
+    )
 
-    while True:
-        try:
-            quantity_str = input("Enter quantity in stock: ").strip()
-            quantity = int(quantity_str)
-            if quantity >= 0:
-                break
-            else:
-                print("Quantity cannot be negative.")
-        except ValueError:
-            print("Invalid input. Please enter a whole number for quantity.")
+    quantity = _prompt_number(
+        "Enter quantity in stock: ",
+        int,
+        "Invalid input. Please enter a whole number for quantity.",
+        "Quantity cannot be negative.",
+    )
 
-    # Create new shoe object and add to list
+    # Create new shoe object and add it as a row across the columns
     new_shoe = Shoe(country, code, product, cost, quantity)
-    shoe_list.append(new_shoe)
+    inventory.append(new_shoe)
     print(f"\n✅ Shoe '{product}' ({code}) added successfully.")
 
-    # Update the inventory file
-    write_shoes_data()
+    # Append the new row to the inventory file (no full rewrite needed)
+    append_shoe(new_shoe)
 
 
 
@@ -197,38 +623,42 @@ def view_all():
     Displays all shoes in the inventory using the tabulate module
     for formatted output.
     """
-    if not shoe_list:
+    if not len(inventory):
         print("\nInventory is empty. Please read data or capture shoes first.")
         return
 
     print("\n👟👟👟 Full Shoe Inventory 👟👟👟")
     headers = ["Country", "Code", "Product", "Cost", "Quantity"]
-    # Create a list of lists for tabulate
+    # Create a list of lists for tabulate by zipping the columns
     table_data = [
-        [s.country, s.code, s.product, f"{s.cost:.2f}", s.quantity]
-        for s in shoe_list
+        [country, code, product, f"{cost:.2f}", qty]
+        for country, code, product, cost, qty in zip(
+            inventory.countries,
+            inventory.codes,
+            inventory.products,
+            inventory.cost,
+            inventory.qty,
+        )
     ]
 
     # Print the table
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    _print_table(table_data, headers)
 
 
 
 def re_stock():
     """
     Finds the shoe with the lowest quantity, prompts the user to restock,
-    and updates the quantity in shoe_list and inventory.txt.
+    and updates the quantity in the inventory and inventory.txt.
     """
-    if not shoe_list:
+    global _inventory_dirty
+    if not len(inventory):
         print("\nInventory is empty. Cannot perform restock.")
         return
 
-    # Find the shoe with the minimum quantity
-    try:
-        min_shoe = min(shoe_list, key=lambda shoe: shoe.quantity)
-    except ValueError:  # Should not happen if shoe_list is not empty, but good practice
-        print("Error finding the shoe with the lowest quantity.")
-        return
+    # Cached between menu visits; recomputed only after it is invalidated
+    min_idx = inventory.min_qty_index()
+    min_shoe = inventory.shoe_at(min_idx)
 
     print(f"\n📉 Shoe with the lowest stock (needs restocking):")
     print("-" * 30)
@@ -240,24 +670,24 @@ def re_stock():
             f"Do you want to add stock for {min_shoe.product} (Code: {min_shoe.code})? (yes/no): "
         ).strip().lower()
         if choice in ["yes", "y"]:
-            while True:
-                try:
-                    add_qty_str = input(
-                        f"Enter quantity to add (current: {min_shoe.quantity}): "
-                    ).strip()
-                    add_qty = int(add_qty_str)
-                    if add_qty >= 0:
-                        min_shoe.quantity += add_qty
-                        print(
-                            f"\n✅ Stock updated. New quantity for {min_shoe.code}: {min_shoe.quantity}"
-                        )
-                        # Update the inventory file
-                        write_shoes_data()
-                        return  # Exit re_stock function
-                    else:
-                        print("Quantity to add cannot be negative.")
-                except ValueError:
-                    print("Invalid input. Please enter a whole number.")
+            add_qty = _prompt_number(
+                f"Enter quantity to add (current: {min_shoe.quantity}): ",
+                int,
+                "Invalid input. Please enter a whole number.",
+                "Quantity to add cannot be negative.",
+            )
+            if not inventory.add_stock(min_idx, add_qty):
+                print(
+                    f"Error: Total quantity cannot exceed {_MAX_QTY}. "
+                    "No changes made to stock."
+                )
+                return  # Exit re_stock function
+            print(
+                f"\n✅ Stock updated. New quantity for {min_shoe.code}: {inventory.qty[min_idx]}"
+            )
+            # Defer the file rewrite until exit/reload
+            _inventory_dirty = True
+            return  # Exit re_stock function
         elif choice in ["no", "n"]:
             print("No changes made to stock.")
             return  # Exit re_stock function
@@ -270,23 +700,43 @@ def search_shoe():
     """
     Searches for a shoe by its code and prints its details if found.
     """
-    if not shoe_list:
+    if not len(inventory):
         print("\nInventory is empty. Cannot perform search.")
         return
 
-    search_code = input("\nEnter the shoe code to search for: ").strip().upper()
+    # Non-empty input also keeps the prefix fallback from matching
+    # every code on a blank search
+    search_code = _prompt_non_empty(
+        "\nEnter the shoe code to search for: ", "Code cannot be empty."
+    ).translate(_UPPER)
 
-    found_shoe = None
-    for shoe in shoe_list:
-        if shoe.code == search_code:
-            found_shoe = shoe
-            break
+    # O(1) lookup in the code index instead of scanning every row
+    idx = inventory.code_index.get(search_code)
+    found_shoe = inventory.shoe_at(idx) if idx is not None else None
 
     if found_shoe:
         print("\n🔍 Shoe Found:")
         print("-" * 30)
         print(found_shoe)
         print("-" * 30)
+        return
+
+    # No exact match: offer codes that start with the entered text
+    prefix_rows = inventory.find_by_prefix(search_code)
+    if prefix_rows:
+        print(f"\nNo exact match for '{search_code}'. Codes starting with it:")
+        headers = ["Country", "Code", "Product", "Cost", "Quantity"]
+        table_data = [
+            [
+                inventory.countries[i],
+                inventory.codes[i],
+                inventory.products[i],
+                f"{inventory.cost[i]:.2f}",
+                inventory.qty[i],
+            ]
+            for i in prefix_rows
+        ]
+        _print_table(table_data, headers)
     else:
         print(f"\n❌ Shoe with code '{search_code}' not found in inventory.")
 
@@ -296,26 +746,23 @@ def value_per_item():
     """
     Calculates and displays the total value (cost * quantity) for each shoe.
     """
-    if not shoe_list:
+    if not len(inventory):
         print("\nInventory is empty. Cannot calculate values.")
         return
 
     print("\n💰 Value Per Shoe Item 💰")
     headers = ["Code", "Product", "Cost", "Quantity", "Total Value"]
-    table_data = []
-    for shoe in shoe_list:
-        value = shoe.cost * shoe.quantity
-        table_data.append(
-            [
-                shoe.code,
-                shoe.product,
-                f"{shoe.cost:.2f}",
-                shoe.quantity,
-                f"{value:.2f}",
-            ]
-        )
+    # One vectorized multiply over the whole column, then format the
+    # numeric columns in C instead of an f-string per row. The widening
+    # to float64 keeps extreme cost * quantity products exact on screen.
+    values = inventory.cost.astype(np.float64) * inventory.qty
+    cost_str = np.char.mod("%.2f", inventory.cost)
+    value_str = np.char.mod("%.2f", values)
+    table_data = list(
+        zip(inventory.codes, inventory.products, cost_str, inventory.qty, value_str)
+    )
 
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    _print_table(table_data, headers)
 
 
 
@@ -323,15 +770,12 @@ def highest_qty():
     """
     Finds the shoe with the highest quantity and marks it as 'FOR SALE'.
     """
-    if not shoe_list:
+    if not len(inventory):
         print("\nInventory is empty.")
         return
 
-    try:
-        max_shoe = max(shoe_list, key=lambda shoe: shoe.quantity)
-    except ValueError:
-        print("Error finding the shoe with the highest quantity.")
-        return
+    # Cached between menu visits; recomputed only after it is invalidated
+    max_shoe = inventory.shoe_at(inventory.max_qty_index())
 
     print("\n✨ FOR SALE (Highest Quantity Item) ✨")
     print("-" * 30)
@@ -379,8 +823,12 @@ def main_menu():
             highest_qty()
         elif choice == "7":
             print("\nReloading data from inventory.txt...")
+            if _inventory_dirty:
+                write_shoes_data()  # Flush pending changes before rereading
             read_shoes_data()  # Reread data from the file
         elif choice == "0":
+            if _inventory_dirty:
+                write_shoes_data()  # Flush pending changes before exiting
             print("\nExiting Inventory Manager. Goodbye! 👋")
             break
         else:
@@ -392,23 +840,5 @@ def main_menu():
 
 # Run the main menu when the script is executed
 if __name__ == "__main__":
-    # Check if tabulate is installed, provide guidance if not
-    try:
-        import tabulate
-    except ImportError:
-        print("*" * 60)
-        print(" Optional dependency 'tabulate' not found.")
-        print(" For nicely formatted tables, please install it:")
-        print("   pip install tabulate")
-        print(" The program will work without it, but tables won't look as good.")
-        print("*" * 60)
-        # Create a dummy tabulate function if it's not installed
-        def tabulate(data, headers, tablefmt):
-            # Simple fallback: print headers and then data rows
-            print("\n" + ", ".join(headers))
-            print("-" * (len(", ".join(headers)) + 5))
-            for row in data:
-                print(", ".join(map(str, row)))
-            return ""  # Return empty string to avoid errors where print(tabulate(...)) is used
-
+    # tabulate is imported lazily by _get_tabulate on first table view
     main_menu()